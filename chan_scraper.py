@@ -6,13 +6,22 @@ import threading
 import tkinter as tk
 import webbrowser
 import ctypes
+import functools
 import tempfile
 import json
+import multiprocessing
+import random
+import re
+import shutil
+import sqlite3
+import time
 import subprocess # Needed for restarting the app
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from urllib.parse import urlparse
 
 # --- New UI Library ---
 import ttkbootstrap as ttk
@@ -21,15 +30,63 @@ from tkinter import messagebox, filedialog
 
 # Third-party dependencies
 import aiohttp
+import PIL
 from PIL import Image, ImageTk, ImageDraw, ImageSequence
 
 # --- Video Engine (VLC) ---
 try:
     import vlc
-    _test_instance = vlc.Instance()
     VIDEO_PLAYER_AVAILABLE = True
 except (ImportError, OSError, NameError):
     VIDEO_PLAYER_AVAILABLE = False
+# Created on first video preview rather than at import: building it loads every VLC plugin,
+# and thumbnail pool workers re-import this module without ever needing it
+_vlc_instance = None
+
+def _get_vlc_instance():
+    """ The shared VLC instance, created on first use; None if VLC can't start. """
+    global _vlc_instance, VIDEO_PLAYER_AVAILABLE
+    if _vlc_instance is None and VIDEO_PLAYER_AVAILABLE:
+        try:
+            _vlc_instance = vlc.Instance()
+        except (OSError, NameError):
+            _vlc_instance = None
+        VIDEO_PLAYER_AVAILABLE = _vlc_instance is not None
+    return _vlc_instance
+
+# --- Faster Event Loop (optional) ---
+try:
+    if sys.platform == 'win32':
+        import winloop as _fast_loop
+    else:
+        import uvloop as _fast_loop
+    asyncio.set_event_loop_policy(_fast_loop.EventLoopPolicy())
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+
+# --- Faster JSON (optional) ---
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dump_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dump_bytes(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+# --- Faster JPEG Decoding (optional) ---
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+    # Smallest first, so the first factor that covers a target box is the cheapest decode
+    _turbo_scales = sorted(_turbo_jpeg.scaling_factors, key=lambda f: f[0] / f[1])
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+    _turbo_scales = []
 
 # --- Configuration ---
 APP_VERSION = "v1.2.0" 
@@ -38,13 +95,50 @@ API_BASE = "https://a.4cdn.org"
 IMG_BASE = "https://i.4cdn.org"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 SETTINGS_FILE = "settings.json"
+CACHE_ROOT = Path.home() / ".cache" / "chan_scraper"
+THUMB_CACHE = CACHE_ROOT / "thumbs"
+CACHE_META_DB = CACHE_ROOT / "meta.db"
+CACHE_REVALIDATE_AFTER = 7 * 24 * 3600  # Seconds before a cached file is re-checked with a conditional GET
+CACHE_MAX_BYTES = 1024 * 1024 * 1024  # Media cache cap; least recently used files are pruned at startup
+UPDATE_CHECK_TTL = 6 * 3600  # Startup checks reuse the cached release response for this long
+_URL_RE = re.compile(r"4chan(?:nel)?\.org/([^/]+)/thread/(\d+)")
+THUMB_SIZE = 150
+TILE_SIZE = THUMB_SIZE + 10
+TILE_GAP = 10
+GRID_COLS = 5
+PREVIEW_CACHE_SIZE = 32
+PREVIEW_WIDTH = 900
+PREVIEW_HEIGHT = 750
+PREVIEW_CHROME = 120  # Vertical space taken by the select button row
+FETCH_CONCURRENCY = 8     # Also the per-host connection cap; more would only queue inside the connector
+DOWNLOAD_CONCURRENCY = 6  # Full-size files, kept below FETCH_CONCURRENCY so thumbnails still get slots
+PREVIEW_DECODED_CACHE_SIZE = 4  # Decoded full-size images are large, keep only the last few
+THUMB_MEMORY_LIMIT = 400  # PhotoImages kept resident; older ones are reloaded from disk when scrolled back
+THUMB_PREFETCH_ROWS = 3   # Rows above/below the viewport whose thumbnails are fetched ahead of scrolling
+# Bytes of fitted RGBA frames per preview window. Each frame ends up as a same-sized PhotoImage and its
+# PIL copy is dropped, so this is roughly what stays resident; longer GIFs are resized per tick instead
+GIF_PRERENDER_BUDGET = 128 * 1024 * 1024
+# Each worker re-imports this whole module (~50 MB); a few already outpace FETCH_CONCURRENCY downloads
+DECODE_PROCESSES = max(1, min(4, (os.cpu_count() or 2) - 1))
+_VIDEO_EXTS = frozenset({'.webm', '.mp4'})
+_GIF_EXTS = frozenset({'.gif'})
+# Pillow decoders to try first by extension, skipping signature probing of every registered plugin
+_PIL_FORMATS = {'.jpg': ("JPEG",), '.jpeg': ("JPEG",), '.png': ("PNG",), '.gif': ("GIF",)}
 
 # --- Logging ---
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("ChanGUI")
 
+# Pillow-SIMD reports versions like "9.0.0.post1"
+if ".post" in PIL.__version__:
+    logger.info(f"Pillow-SIMD detected ({PIL.__version__})")
+# Image.Resampling arrived in Pillow 9.1; Pillow 9.0 and the Pillow-SIMD 9.0 builds
+# only have the old module-level constants
+_Resampling = getattr(Image, "Resampling", Image)
+
+@functools.lru_cache(maxsize=32)
 def get_resource_path(relative_path):
-    """ Robustly find the path to a resource file. """
+    """ Robustly find the path to a resource file. Cached, since the lookup stats up to four candidates. """
     try:
         if hasattr(sys, '_MEIPASS'):
             return os.path.join(sys._MEIPASS, relative_path)
@@ -65,114 +159,459 @@ def get_resource_path(relative_path):
         pass
     return os.path.abspath(relative_path)
 
-@dataclass
+def parse_version(v_str):
+    try:
+        return tuple(map(int, v_str.lstrip('v').split('.')))
+    except ValueError:
+        return (0, 0, 0)
+
+_LOCAL_VER = parse_version(APP_VERSION)  # Parsed once; update checks compare against it
+
+def _open_image(data, box=None, formats=None):
+    """
+    Decode image bytes, via libjpeg-turbo directly when available. With a `box`,
+    JPEGs are decoded at the smallest DCT scale that still covers it. `formats`
+    narrows Pillow's format detection; anything it rejects is retried without it.
+    """
+    if _turbo_jpeg and data[:2] == b'\xff\xd8':
+        try:
+            scale = (1, 1)
+            if box:
+                width, height, _, _ = _turbo_jpeg.decode_header(data)
+                needed = min(box[0] / width, box[1] / height)
+                for num, denom in _turbo_scales:
+                    if num / denom >= needed:
+                        scale = (num, denom)
+                        break
+            # Decodes straight to pixels; nothing keeps the source bytes alive afterwards
+            arr = _turbo_jpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=scale)
+            return Image.fromarray(arr)
+        except Exception as e:
+            logger.debug(f"TurboJPEG decode failed, falling back to PIL: {e}")
+    try:
+        pil_img = Image.open(BytesIO(data), formats=formats)
+    except PIL.UnidentifiedImageError:
+        if formats is None:
+            raise
+        pil_img = Image.open(BytesIO(data))
+    if box and pil_img.format == "JPEG":
+        # libjpeg picks the largest 1/2, 1/4, 1/8 IDCT scale that still covers the box
+        pil_img.draft("RGB", box)
+    return pil_img
+
+def fit_preview(pil_img, box):
+    """ Scale a full-size image to fit `box`, doubling small images. Safe to run off the Tk thread. """
+    win_w, win_h = box
+    img_w, img_h = pil_img.size
+    ratio = min(win_w/img_w, win_h/img_h)
+    if ratio < 1:
+        new_size = (int(img_w * ratio), int(img_h * ratio))
+        # Past 2x, BILINEAR's widened support already averages enough source pixels;
+        # LANCZOS is kept for the mild reductions where its sharpness shows
+        return pil_img.resize(new_size, _Resampling.BILINEAR if ratio < 0.5 else _Resampling.LANCZOS)
+    elif ratio > 1 and img_w < 400:
+        new_size = (int(img_w * 2), int(img_h * 2))
+        return pil_img.resize(new_size, _Resampling.BILINEAR)
+    return pil_img
+
+def prerender_frames(pil_img, box):
+    """ Fit every frame of an animated image once. Returns [(frame, duration_ms)], or None if over budget. """
+    frames = []
+    used = 0
+    for frame in ImageSequence.Iterator(pil_img):
+        fitted = fit_preview(frame.convert("RGBA"), box)
+        used += fitted.width * fitted.height * 4
+        if used > GIF_PRERENDER_BUDGET:
+            return None
+        frames.append((fitted, max(frame.info.get('duration', 100), 20)))
+    return frames
+
+def decode_preview(data, box, ext=None):
+    """
+    Returns (original, fitted). For animated images `fitted` is the prerender_frames() list,
+    or None when the animation is too large to hold and has to be framed on the Tk side.
+    """
+    # The preview box never changes, so large JPEGs are decoded at a reduced DCT scale;
+    # the "original" kept in preview_images is then only as large as the window needs
+    pil_img = _open_image(data, box, _PIL_FORMATS.get(ext))
+    if getattr(pil_img, "is_animated", False):
+        return pil_img, prerender_frames(pil_img, box)
+    # Force the decode here so the cached original really skips it next time,
+    # and so the decoder releases its reference to the source bytes
+    pil_img.load()
+    return pil_img, fit_preview(pil_img, box)
+
+@functools.lru_cache(maxsize=None)
+def _badge(ext_text, is_gif):
+    """ Pre-rendered type badge; only a handful of extensions exist, so each is drawn once per process. """
+    badge = Image.new("RGBA", (41, 16), "#0984e3" if is_gif else "red")
+    ImageDraw.Draw(badge).text((2, 1), ext_text, fill="white")
+    return badge
+
+def prune_cache(root, limit, meta_db_path=None):
+    """
+    Delete the least recently used files under `root` until it fits in `limit` bytes.
+    Their validator rows in `meta_db_path`, if given, are dropped with them.
+    """
+    entries = []
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            # atime may be coarse (relatime) or off (noatime); mtime is bumped on revalidation
+            entries.append((max(st.st_atime, st.st_mtime), st.st_size, path))
+            total += st.st_size
+    if total <= limit:
+        return
+    entries.sort()
+    removed = []
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed.append(path)
+        if total <= limit:
+            break
+    logger.info(f"Pruned {len(removed)} files from the media cache")
+    if removed and meta_db_path and os.path.exists(meta_db_path):
+        try:
+            # Own connection: this runs on a throwaway thread, before or alongside the worker's
+            conn = sqlite3.connect(meta_db_path)
+            try:
+                conn.executemany("DELETE FROM validators WHERE path = ?", ((p,) for p in removed))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to drop validators for pruned files: {e}")
+
+def decode_thumbnail(data, ext, is_video, is_gif, resized_path=None):
+    """ Decode, downscale and badge a thumbnail. Runs in the decode pool, off the Tk thread. """
+    # 4chan thumbnails, and our resized copies, are always JPEG
+    pil_img = _open_image(data, (THUMB_SIZE, THUMB_SIZE), _PIL_FORMATS['.jpg'])
+    pil_img.thumbnail((THUMB_SIZE, THUMB_SIZE), _Resampling.BILINEAR)
+    if resized_path and not resized_path.exists():
+        try:
+            resized_path.parent.mkdir(parents=True, exist_ok=True)
+            # Saved aside and renamed; a torn copy would be preferred on every later load
+            part_path = resized_path.with_name(resized_path.name + ".part")
+            pil_img.convert("RGB").save(part_path, "JPEG", quality=90)
+            os.replace(part_path, resized_path)
+        except Exception as e:
+            logger.error(f"Failed to cache resized thumb: {e}")
+    # Centre on a fixed-size tile so every result fits a recycled PhotoImage
+    tile = Image.new("RGBA", (THUMB_SIZE, THUMB_SIZE), (0, 0, 0, 0))
+    offset = ((THUMB_SIZE - pil_img.width) // 2, (THUMB_SIZE - pil_img.height) // 2)
+    tile.paste(pil_img.convert("RGBA"), offset)
+    if is_video or is_gif:
+        # Opaque, so a plain paste; cropped to the image like the old in-place rectangle
+        badge = _badge(ext.upper().lstrip('.'), is_gif)
+        if pil_img.width < badge.width or pil_img.height < badge.height:
+            badge = badge.crop((0, 0, min(badge.width, pil_img.width), min(badge.height, pil_img.height)))
+        tile.paste(badge, offset)
+    return tile.tobytes(), tile.size
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to a regular __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MediaItem:
     tim: int
     ext: str
     filename: str
     board: str
     fsize: int = 0
-    
-    @property
-    def full_url(self) -> str:
-        return f"{IMG_BASE}/{self.board}/{self.tim}{self.ext}"
-    
-    @property
-    def thumb_url(self) -> str:
-        return f"{IMG_BASE}/{self.board}/{self.tim}s.jpg"
-    
-    @property
-    def local_filename(self) -> str:
-        return f"{self.tim}{self.ext}"
-    
-    @property
-    def is_video(self) -> bool:
-        return self.ext.lower() in ['.webm', '.mp4']
-
-    @property
-    def is_gif(self) -> bool:
-        return self.ext.lower() == '.gif'
+    # Derived once in __post_init__; these are read in every grid/download loop
+    full_url: str = field(init=False, repr=False)
+    thumb_url: str = field(init=False, repr=False)
+    local_filename: str = field(init=False, repr=False)
+    is_video: bool = field(init=False, repr=False)
+    is_gif: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen, so derived fields have to bypass __setattr__
+        ext = self.ext.lower()
+        object.__setattr__(self, 'full_url', f"{IMG_BASE}/{self.board}/{self.tim}{self.ext}")
+        object.__setattr__(self, 'thumb_url', f"{IMG_BASE}/{self.board}/{self.tim}s.jpg")
+        object.__setattr__(self, 'local_filename', f"{self.tim}{self.ext}")
+        object.__setattr__(self, 'is_video', ext in _VIDEO_EXTS)
+        object.__setattr__(self, 'is_gif', ext in _GIF_EXTS)
 
 class AsyncWorker:
     """Handles async network tasks in a separate thread."""
     def __init__(self, loop):
         self.loop = loop
         self.session = None
+        self.sem = None
+        self.download_sem = None
+        self.meta_db = None
+        self._meta_lock = threading.Lock()
 
     async def init_session(self):
-        self.session = aiohttp.ClientSession(headers={"User-Agent": USER_AGENT})
+        # Created here so the semaphore binds to the worker loop, not the Tk thread
+        self.sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+        self.download_sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        self.meta_db = self._open_meta_db()
+        # One pooled session for the app's lifetime so bursts reuse keep-alive sockets
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=FETCH_CONCURRENCY,
+            # Long enough to survive the pause between loading a thread and downloading from it
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT},
+            # No total cap: full-size videos and updates may legitimately take longer than 30s
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+        )
 
     async def close_session(self):
         if self.session:
             await self.session.close()
+        if self.meta_db:
+            with self._meta_lock:
+                self.meta_db.close()
+                self.meta_db = None
+
+    # --- Cache Validators (ETag / Last-Modified) ---
+    @staticmethod
+    def _open_meta_db():
+        try:
+            CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+            # Queries run on executor threads, serialized by _meta_lock
+            conn = sqlite3.connect(str(CACHE_META_DB), check_same_thread=False)
+            # Validators are only a hint; losing the last few on a power cut just costs a full GET
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS validators (path TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)")
+            conn.commit()
+            return conn
+        except Exception as e:
+            logger.error(f"Failed to open cache metadata: {e}")
+            return None
+
+    def _get_validators(self, cache_path):
+        with self._meta_lock:
+            if not self.meta_db:
+                return None
+            return self.meta_db.execute(
+                "SELECT etag, last_modified FROM validators WHERE path = ?", (str(cache_path),)
+            ).fetchone()
+
+    def _set_validators(self, cache_path, etag, last_modified):
+        with self._meta_lock:
+            if not self.meta_db or not (etag or last_modified):
+                return
+            try:
+                self.meta_db.execute(
+                    "INSERT OR REPLACE INTO validators (path, etag, last_modified) VALUES (?, ?, ?)",
+                    (str(cache_path), etag, last_modified)
+                )
+                self.meta_db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to store validators for {cache_path}: {e}")
 
     async def fetch_json(self, url):
         async with self.session.get(url) as response:
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=json_loads)
             return None
 
-    async def fetch_image_bytes(self, url):
+    async def _with_retry(self, url, handle, tries=4, headers=None):
+        """
+        GET `url` and return `handle(response)`, retrying transient failures.
+        429/503 honour Retry-After; connection errors back off exponentially with jitter.
+        """
+        for attempt in range(tries):
+            last_try = attempt == tries - 1
+            try:
+                async with self.sem, self.session.get(url, headers=headers) as response:
+                    if response.status in (429, 503) and not last_try:
+                        try:
+                            delay = min(30, int(response.headers.get('Retry-After', '2')))
+                        except ValueError:
+                            delay = 2
+                    else:
+                        return await handle(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_try:
+                    raise
+                logger.warning(f"Retrying {url} after error: {e}")
+                delay = min(30, 0.5 * 2 ** attempt) + random.random() * 0.3
+            # Sleep outside the semaphore so a backing-off request doesn't hold a slot
+            await asyncio.sleep(delay)
+
+    async def fetch_image_bytes(self, url, cache_path=None, headers=None, revalidate=False):
+        """
+        GET `url`, serving `cache_path` when present.
+        With `revalidate`, cache entries older than CACHE_REVALIDATE_AFTER are re-checked with a conditional GET.
+        """
+        headers = dict(headers or {})
+        cached = False
+        if cache_path and cache_path.exists():
+            cached = True
+            try:
+                age = time.time() - cache_path.stat().st_mtime
+                if not revalidate or age < CACHE_REVALIDATE_AFTER:
+                    return await self.loop.run_in_executor(None, cache_path.read_bytes)
+                # Stale: revalidate so an unchanged file costs headers only
+                validators = await self.loop.run_in_executor(None, self._get_validators, cache_path)
+                if validators:
+                    etag, last_modified = validators
+                    if etag:
+                        headers['If-None-Match'] = etag
+                    if last_modified:
+                        headers['If-Modified-Since'] = last_modified
+            except Exception as e:
+                logger.error(f"Failed to read cache {cache_path}: {e}")
+
+        async def read_body(response):
+            if response.status == 304 and cached:
+                return None, None, True
+            if response.status == 200:
+                validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return await self._read_sized(response), validators, False
+            return None, None, False
+
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.read()
+            data, validators, not_modified = await self._with_retry(url, read_body, headers=headers or None)
+            if not_modified:
+                # 304 Not Modified: refresh the file's age and serve it
+                os.utime(cache_path)
+                return await self.loop.run_in_executor(None, cache_path.read_bytes)
+            if data and cache_path:
+                await self.loop.run_in_executor(None, self._write_cache, cache_path, data)
+                if revalidate:
+                    # Not awaited: the caller shouldn't wait on a database commit to get its bytes
+                    self.loop.run_in_executor(None, self._set_validators, cache_path, *validators)
+            return data
         except Exception as e:
             logger.error(f"Failed to fetch {url}: {e}")
         return None
 
-    async def download_to_temp(self, url, suffix):
+    @staticmethod
+    async def _read_sized(response):
+        """ Read a body in one allocation when its length is known up front. """
+        length = response.content_length
+        # Content-Length is the encoded size, so only trust it for identity bodies
+        if length and 'Content-Encoding' not in response.headers:
+            return await response.content.readexactly(length)
+        return await response.read()
+
+    @staticmethod
+    def _write_cache(cache_path, data):
+        # Written aside and renamed, so a crash can't leave a torn file that looks fresh
+        part_path = cache_path.with_name(cache_path.name + ".part")
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.read()
-                    fd, path = tempfile.mkstemp(suffix=suffix)
-                    with os.fdopen(fd, 'wb') as tmp:
-                        tmp.write(data)
-                    return path
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            part_path.write_bytes(data)
+            os.replace(part_path, cache_path)
         except Exception as e:
-            logger.error(f"Failed to download temp video: {e}")
+            logger.error(f"Failed to write cache {cache_path}: {e}")
+
+    async def download_to_temp(self, url, suffix):
+        """ Stream a video into a temp file for the player; returns its path, or None on failure. """
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        if await self.download_to_file(url, path):
+            return path
+        try:
+            os.remove(path)
+        except OSError:
+            pass
         return None
 
+    @staticmethod
+    def _commit_part(f, part_path, dest_path):
+        """ Close a finished .part file and move it into place in one atomic rename. """
+        f.flush()
+        if hasattr(os, "posix_fadvise"):
+            # Downloaded media isn't read back soon; let the kernel drop it from the page cache
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+        f.close()
+        os.replace(part_path, dest_path)
+
+    async def download_to_file(self, url, dest_path, chunk_size=64 * 1024, on_progress=None):
+        """
+        Stream a response straight to disk so large media is never held in memory.
+        Data goes to `<dest>.part` first, so `dest_path` only ever exists complete.
+        `on_progress(delta_bytes)` is called per chunk, and with a negative delta if an attempt is discarded.
+        """
+        part_path = f"{dest_path}.part"
+        async def stream_body(response):
+            if response.status != 200:
+                return False
+            # open/write/close are all blocking syscalls, keep them off the loop
+            f = await self.loop.run_in_executor(None, open, part_path, 'wb')
+            written = 0
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    await self.loop.run_in_executor(None, f.write, chunk)
+                    written += len(chunk)
+                    if on_progress:
+                        on_progress(len(chunk))
+            except BaseException:
+                if on_progress and written:
+                    on_progress(-written)
+                await self.loop.run_in_executor(None, f.close)
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                raise
+            await self.loop.run_in_executor(None, self._commit_part, f, part_path, dest_path)
+            return True
+
+        try:
+            return await self._with_retry(url, stream_body)
+        except Exception as e:
+            logger.error(f"Failed to download {url}: {e}")
+        return False
+
     # --- Updater Logic ---
-    async def check_update(self):
-        if not self.session: return None
+    async def check_update(self, cache=None, use_ttl=True):
+        """
+        Returns (release_data_if_newer, new_cache). `cache` is the {etag, data, fetched_at}
+        dict from settings; new_cache is None when nothing needs saving.
+        """
+        if not self.session: return None, None
+        cache = cache or {}
         api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+        release, new_cache = None, None
         try:
-            async with self.session.get(api_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    latest_tag = data.get("tag_name", "").strip()
-                    
-                    if latest_tag:
-                        def parse_version(v_str):
-                            try:
-                                return tuple(map(int, v_str.lstrip('v').split('.')))
-                            except ValueError:
-                                return (0, 0, 0)
-                        
-                        remote_ver = parse_version(latest_tag)
-                        local_ver = parse_version(APP_VERSION)
-
-                        if remote_ver > local_ver:
-                            return data
+            if use_ttl and cache.get("data") and time.time() - cache.get("fetched_at", 0) < UPDATE_CHECK_TTL:
+                release = cache["data"]
+            else:
+                headers = {"If-None-Match": cache["etag"]} if cache.get("etag") and cache.get("data") else None
+                async with self.session.get(api_url, headers=headers) as response:
+                    if response.status == 304:
+                        # Unchanged; doesn't count against the GitHub rate limit
+                        release = cache["data"]
+                        new_cache = dict(cache, fetched_at=time.time())
+                    elif response.status == 200:
+                        release = await response.json(loads=json_loads)
+                        new_cache = {"etag": response.headers.get("ETag"), "data": release, "fetched_at": time.time()}
+            latest_tag = (release or {}).get("tag_name", "").strip()
+            if latest_tag and parse_version(latest_tag) > _LOCAL_VER:
+                return release, new_cache
         except Exception as e:
             logger.error(f"Update check failed: {e}")
-        return None
+        return None, new_cache
 
     async def download_file(self, url, dest_path):
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    with open(dest_path, 'wb') as f:
-                        while True:
-                            chunk = await response.content.read(1024*1024)
-                            if not chunk: break
-                            f.write(chunk)
-                    return True
-        except Exception as e:
-            logger.error(f"Download failed: {e}")
-        return False
+        return await self.download_to_file(url, dest_path)
 
 class ChanScraperApp(ttk.Window):
     def __init__(self):
@@ -189,22 +628,68 @@ class ChanScraperApp(ttk.Window):
                 pass
 
         self.icon_path = get_resource_path("icon.ico")
+        self.has_icon = os.path.exists(self.icon_path)  # Checked once instead of per dialog
+        self._icon_photos = {}  # size -> PhotoImage of the app icon, see _icon_photo
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 self.iconbitmap(self.icon_path)
         except Exception as e:
             logger.error(f"Failed to load icon: {e}")
 
         self.settings = self.load_settings()
+        self._save_settings_job = None
+        self._saved_settings_payload = None
+        # Single worker so settings writes land in the order they were requested
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        # Its own daemon thread: walking a full cache must not hold up settings writes or closing
+        threading.Thread(target=prune_cache, args=(str(THUMB_CACHE), CACHE_MAX_BYTES, str(CACHE_META_DB)), daemon=True).start()
+
+        try:
+            THUMB_CACHE.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to create thumbnail cache: {e}")
 
         self.loop = asyncio.new_event_loop()
+        if FAST_LOOP_AVAILABLE:
+            logger.info(f"Using {_fast_loop.__name__} event loop")
+        self.decode_pool = ThreadPoolExecutor(max_workers=4)  # Previews; their PIL images stay in-process
+        # Thumbnails decode on threads until the process pool is up, and again if it ever breaks
+        self.thumb_pool = self.decode_pool
+        self._process_pool = None
+        try:
+            # Thumbnail decode is pure CPU and returns only bytes, so it can run outside the GIL.
+            # "spawn" because forking after Tk and the loop thread have started is unsafe.
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=DECODE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+            # Workers spawn and re-import this module on first submit; warm them up in the background
+            self._process_pool.submit(int).add_done_callback(self._on_process_pool_ready)
+        except (OSError, ValueError, NotImplementedError, BrokenProcessPool) as e:
+            logger.error(f"Process pool unavailable, decoding thumbnails on threads: {e}")
         self.worker = AsyncWorker(self.loop)
         self.thread = threading.Thread(target=self._start_async_loop, daemon=True)
         self.thread.start()
         
         self.media_items = []
         self.selected_items = set() 
-        self.thumbnails = {}
+        self._selected_bytes = 0  # Running fsize total of selected_items, so the button label is O(1)
+        self._fsize_by_tim = {}   # tim -> fsize, for full recounts of _selected_bytes
+        self.thumbnails = OrderedDict()  # tile index -> PhotoImage, LRU bounded by THUMB_MEMORY_LIMIT
+        self._thumbs_inflight = set()
+        self._photo_pool = []  # Spare THUMB_SIZE PhotoImages, refilled with paste() instead of reallocated
+        self._ui_queue = deque()  # Callbacks from the worker loop, run in batches by _pump_ui
+        self._visible_check_pending = False
+        # Grid state is positional: tile i shows media_items[i], so it is indexed rather than keyed by tim
+        self.tiles = []       # index -> (image_id, rect_id, text_id) on the grid canvas
+        self.tile_items = {}  # canvas item id -> MediaItem, for click hit-testing
+        self._index_by_tim = {}  # For the few callers that start from a MediaItem
+        self._dl_counter = None  # Shared download progress while a batch runs, see start_download
+        self._dl_total = 0
+        self._grid_generation = 0  # Bumped per thread load, so late thumbnails of the old grid are dropped
+        self.preview_cache = OrderedDict()  # tim -> full-size bytes, LRU; only touched from the worker loop
+        self.preview_images = OrderedDict()  # tim -> decoded PIL image, LRU; only touched from the Tk thread
+        self._thumbs_done = set()    # Indices fetched at least once, for the status count
+        self._thumbs_failed = set()  # Indices whose thumbnail failed; not retried on every scroll
         self.board = ""
         self.thread_id = ""
         self.context_menu_target = None
@@ -215,6 +700,15 @@ class ChanScraperApp(ttk.Window):
         if self.settings.get("check_updates", True):
             self.after(2000, lambda: self.check_updates(silent=True))
 
+        self.after(16, self._pump_ui)
+
+    def _on_process_pool_ready(self, future):
+        # Runs on the pool's management thread; swapping the attribute is all it does
+        if not future.cancelled() and future.exception() is None:
+            self.thumb_pool = self._process_pool
+        else:
+            logger.error("Thumbnail process pool failed to start, decoding on threads")
+
     def _start_async_loop(self):
         asyncio.set_event_loop(self.loop)
         self.loop.run_forever()
@@ -222,6 +716,26 @@ class ChanScraperApp(ttk.Window):
     def _run_async(self, coro):
         asyncio.run_coroutine_threadsafe(coro, self.loop)
 
+    def _post(self, callback):
+        """ Queue a callback for the Tk thread; deque.append is thread-safe and needs no Tk call. """
+        self._ui_queue.append(callback)
+
+    def _pump_ui(self):
+        """ Run queued callbacks from a single Tk timer instead of one after(0) event each. """
+        # Re-arm first: a callback that opens a modal dialog spins a nested event loop,
+        # and the queue has to keep draining underneath it
+        self.after(16, self._pump_ui)
+        q = self._ui_queue
+        for _ in range(32):
+            try:
+                callback = q.popleft()
+            except IndexError:
+                break  # Drained, possibly by a nested pump
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"UI callback failed: {e}")
+
     def load_settings(self):
         default_settings = {
             "download_path": str(Path.home() / "Downloads" / "4chan Media Scraper"),
@@ -231,23 +745,44 @@ class ChanScraperApp(ttk.Window):
         }
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r") as f:
-                    saved_settings = json.load(f)
-                    default_settings.update(saved_settings)
+                default_settings.update(json_loads(Path(SETTINGS_FILE).read_bytes()))
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
         return default_settings
 
-    def save_settings(self):
+    def schedule_save_settings(self, delay=500):
+        """ Debounced save for toggles; repeated changes within `delay` ms cost one write. """
+        if self._save_settings_job:
+            self.after_cancel(self._save_settings_job)
+        self._save_settings_job = self.after(delay, self.save_settings)
+
+    def save_settings(self, wait=False):
+        if self._save_settings_job:
+            self.after_cancel(self._save_settings_job)
+            self._save_settings_job = None
         settings = {
             "download_path": self.path_var.get(),
             "auto_load": self.autoload_var.get(),
             "use_subdirs": self.use_subdirs_var.get(),
-            "check_updates": self.autocheck_var.get()
+            "check_updates": self.autocheck_var.get(),
+            "update_cache": self.settings.get("update_cache")
         }
         try:
-            with open(SETTINGS_FILE, "w") as f:
-                json.dump(settings, f, indent=4)
+            payload = json_dump_bytes(settings)
+        except Exception as e:
+            logger.error(f"Failed to save settings: {e}")
+            return
+        # Tk variables are read here on the Tk thread; only the disk write is handed off
+        if payload != self._saved_settings_payload:
+            self._saved_settings_payload = payload
+            self._io_executor.submit(self._write_settings, payload)
+        if wait:
+            self._io_executor.shutdown(wait=True)
+
+    @staticmethod
+    def _write_settings(payload):
+        try:
+            Path(SETTINGS_FILE).write_bytes(payload)
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
 
@@ -266,7 +801,7 @@ class ChanScraperApp(ttk.Window):
         help_menu.add_command(label="Check for Updates", command=lambda: self.check_updates(silent=False))
         
         self.autocheck_var = tk.BooleanVar(value=self.settings.get("check_updates", True))
-        help_menu.add_checkbutton(label="Check on Startup", onvalue=True, offvalue=False, variable=self.autocheck_var, command=self.save_settings)
+        help_menu.add_checkbutton(label="Check on Startup", onvalue=True, offvalue=False, variable=self.autocheck_var, command=self.schedule_save_settings)
         
         help_menu.add_separator()
         help_menu.add_command(label="View Help", command=self.show_help)
@@ -312,11 +847,11 @@ class ChanScraperApp(ttk.Window):
 
         self.canvas = tk.Canvas(self.canvas_frame, bg="#ffffff", highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self.canvas_frame, orient="vertical", command=self.canvas.yview, bootstyle="round")
-        self.scrollable_frame = ttk.Frame(self.canvas)
-
-        self.scrollable_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_grid_scroll)
+        self.canvas.bind("<Configure>", lambda e: self._schedule_visible_check())
+        # Bound on the tag, so clicks in the gaps between tiles never reach Python
+        self.canvas.tag_bind("tile", "<Button-1>", self._on_grid_click)
+        self.canvas.tag_bind("tile", "<Button-3>", self._on_grid_right_click)
 
         self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
         self.scrollbar.pack(side=RIGHT, fill=Y)
@@ -349,6 +884,9 @@ class ChanScraperApp(ttk.Window):
 
         self.download_btn = ttk.Button(right_panel, text="Download Selected (0)", command=self.start_download, state=DISABLED, bootstyle="success")
         self.download_btn.pack(side=LEFT)
+        # Selection changes only write the count; the trace keeps the button label in step
+        self.selected_count_var = tk.IntVar(value=0)
+        self.selected_count_var.trace_add("write", lambda *_: self.update_download_btn())
 
     def open_thread_browser(self):
         url = self.url_entry.get().strip()
@@ -360,13 +898,17 @@ class ChanScraperApp(ttk.Window):
     def check_updates(self, silent=False):
         if not silent:
             self.status_var.set("Checking for updates...")
-        self._run_async(self._process_update_check(silent))
+        # Manual checks skip the TTL but still revalidate with the stored ETag
+        self._run_async(self._process_update_check(silent, self.settings.get("update_cache")))
 
-    async def _process_update_check(self, silent):
-        update_data = await self.worker.check_update()
-        self.after(0, lambda: self._show_update_ui(update_data, silent))
+    async def _process_update_check(self, silent, cache):
+        update_data, new_cache = await self.worker.check_update(cache, use_ttl=silent)
+        self._post(lambda: self._show_update_ui(update_data, silent, new_cache))
 
-    def _show_update_ui(self, update_data, silent):
+    def _show_update_ui(self, update_data, silent, new_cache=None):
+        if new_cache:
+            self.settings["update_cache"] = new_cache
+            self.schedule_save_settings()
         if update_data:
             self.show_update_dialog(update_data)
         elif not silent:
@@ -380,7 +922,7 @@ class ChanScraperApp(ttk.Window):
         up_win.resizable(False, False)
         
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 up_win.iconbitmap(self.icon_path)
         except: pass
         
@@ -392,14 +934,9 @@ class ChanScraperApp(ttk.Window):
         frame.pack(fill=BOTH, expand=True)
 
         try:
-            if os.path.exists(self.icon_path):
-                with Image.open(self.icon_path) as img:
-                    img = img.convert("RGBA")
-                    pil_img = img.resize((48, 48), Image.Resampling.LANCZOS)
-                    tk_icon = ImageTk.PhotoImage(pil_img)
-                    icon_lbl = ttk.Label(frame, image=tk_icon)
-                    icon_lbl.image = tk_icon
-                    icon_lbl.grid(row=0, column=0, rowspan=2, padx=(0, 15))
+            if self.has_icon:
+                icon_lbl = ttk.Label(frame, image=self._icon_photo(48))
+                icon_lbl.grid(row=0, column=0, rowspan=2, padx=(0, 15))
             else:
                 ttk.Label(frame, text="✅", font=("Segoe UI", 32)).grid(row=0, column=0, rowspan=2, padx=(0, 15))
         except Exception:
@@ -416,7 +953,7 @@ class ChanScraperApp(ttk.Window):
         upd_win.geometry("500x450")
         
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 upd_win.iconbitmap(self.icon_path)
         except: pass
         
@@ -492,17 +1029,17 @@ class ChanScraperApp(ttk.Window):
             target_filename = "chan_scraper.py"
 
         if not download_url:
-            self.after(0, lambda: messagebox.showerror("Error", "Could not find a suitable update file."))
-            self.after(0, lambda: self.status_var.set("Update failed."))
+            self._post(lambda: self.after_idle(messagebox.showerror, "Error", "Could not find a suitable update file."))
+            self._post(lambda: self.status_var.set("Update failed."))
             return
 
         success = await self.worker.download_file(download_url, target_filename)
         
         if success:
-            self.after(0, lambda: self._apply_update(target_filename, is_frozen))
+            self._post(lambda: self._apply_update(target_filename, is_frozen))
         else:
-            self.after(0, lambda: messagebox.showerror("Error", "Failed to download update."))
-            self.after(0, lambda: self.status_var.set("Update failed."))
+            self._post(lambda: self.after_idle(messagebox.showerror, "Error", "Failed to download update."))
+            self._post(lambda: self.status_var.set("Update failed."))
 
     def _apply_update(self, new_file, is_frozen):
         if is_frozen:
@@ -548,14 +1085,8 @@ del "%~f0"
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def parse_url(self, url):
-        try:
-            parsed = urlparse(url)
-            parts = parsed.path.strip("/").split("/")
-            if len(parts) >= 3 and parts[1] == "thread":
-                return parts[0], parts[2]
-        except:
-            pass
-        return None, None
+        m = _URL_RE.search(url)
+        return (m.group(1), m.group(2)) if m else (None, None)
 
     def browse_folder(self):
         path = filedialog.askdirectory()
@@ -571,62 +1102,99 @@ del "%~f0"
             self.status_var.set("Invalid URL format")
             return
         self.status_var.set(f"Fetching thread /{self.board}/{self.thread_id}...")
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.canvas.delete("all")
+        # The old thread's scrollregion would otherwise linger until the new grid is laid out
+        self.canvas.configure(scrollregion=(0, 0, 0, 0))
+        self.canvas.yview_moveto(0)
         self.media_items.clear()
+        self._fsize_by_tim = {}
         self.selected_items.clear()
+        for tk_img in self.thumbnails.values():
+            self._recycle_photo(tk_img)
         self.thumbnails.clear()
-        self.update_download_btn()
+        self._thumbs_inflight.clear()
+        self.tiles.clear()
+        self.tile_items.clear()
+        self._index_by_tim.clear()
+        self._grid_generation += 1
+        self._thumbs_done.clear()
+        self._thumbs_failed.clear()
+        self._selected_bytes = 0
+        self.selected_count_var.set(0)
         self.progress_var.set(0)
-        self._run_async(self._async_load_thread())
+        self._run_async(self._async_load_thread(self.board, self.thread_id, self._grid_generation))
 
-    async def _async_load_thread(self):
-        api_url = f"{API_BASE}/{self.board}/thread/{self.thread_id}.json"
+    async def _async_load_thread(self, board, thread_id, generation):
+        api_url = f"{API_BASE}/{board}/thread/{thread_id}.json"
         data = await self.worker.fetch_json(api_url)
+        if generation != self._grid_generation:
+            return  # Superseded by a later load, e.g. paste with auto-load firing twice
         if not data:
-            self.after(0, lambda: messagebox.showerror("Error", "Thread not found or API error"))
-            self.after(0, lambda: self.status_var.set("Error fetching thread"))
+            self._post(lambda: self.after_idle(messagebox.showerror, "Error", "Thread not found or API error"))
+            self._post(lambda: self.status_var.set("Error fetching thread"))
             return
         posts = data.get('posts', [])
-        seen_tim = set()
-        for post in posts:
-            if 'tim' in post and 'ext' in post:
-                if post['tim'] not in seen_tim:
-                    item = MediaItem(
-                        tim=post['tim'], 
-                        ext=post['ext'], 
-                        filename=post.get('filename', ''), 
-                        board=self.board, 
-                        fsize=post.get('fsize', 0) 
-                    )
-                    self.media_items.append(item)
-                    seen_tim.add(post['tim'])
-        self.after(0, lambda: self.status_var.set(f"Found {len(self.media_items)} items. Loading thumbnails..."))
-        self.after(0, self.render_grid_placeholders)
-        await self._fetch_thumbnails()
-
-    def render_grid_placeholders(self):
-        cols = 5
+        # Keyed by tim, so the comprehension dedupes while keeping first-seen order
+        items = {
+            post['tim']: MediaItem(
+                tim=post['tim'], 
+                ext=post['ext'], 
+                filename=post.get('filename', ''), 
+                board=board, 
+                fsize=post.get('fsize', 0) 
+            )
+            for post in posts if 'tim' in post and 'ext' in post
+        }
+        fsize_by_tim = {tim: item.fsize for tim, item in items.items()}
+        self._post(lambda: self.render_grid_placeholders(list(items.values()), fsize_by_tim, generation))
+
+    def render_grid_placeholders(self, media_items, fsize_by_tim, generation):
+        # Re-checked here too: another load may have started while this one sat in the UI queue
+        if generation != self._grid_generation:
+            return
+        self.media_items = media_items
+        self._fsize_by_tim = fsize_by_tim
+        self.status_var.set(f"Found {len(media_items)} items. Loading thumbnails...")
+        # Tiles are plain canvas items rather than widgets, so big threads stay cheap
+        step = TILE_SIZE + TILE_GAP
         for i, item in enumerate(self.media_items):
-            row = i // cols
-            col = i % cols
-            frame = tk.Frame(self.scrollable_frame, bg="white", bd=2, relief=tk.FLAT)
-            frame.grid(row=row, column=col, padx=5, pady=5)
-            frame.item = item
-            frame.bind("<Button-1>", lambda e, f=frame, it=item: self.toggle_selection(f, it))
-            frame.bind("<Button-3>", lambda e, f=frame, it=item: self.open_preview(f, it))
-            lbl = tk.Label(frame, text="Loading...", width=20, height=10, bg="#f0f0f0")
-            lbl.pack()
-            lbl.bind("<Button-1>", lambda e, f=frame, it=item: self.toggle_selection(f, it))
-            lbl.bind("<Button-3>", lambda e, f=frame, it=item: self.open_preview(f, it))
-            frame.lbl = lbl
-
-    def open_preview(self, frame_widget, item):
+            x0 = TILE_GAP + (i % GRID_COLS) * step
+            y0 = TILE_GAP + (i // GRID_COLS) * step
+            cx = x0 + TILE_SIZE // 2
+            cy = y0 + TILE_SIZE // 2
+            rect_id = self.canvas.create_rectangle(x0, y0, x0 + TILE_SIZE, y0 + TILE_SIZE, fill="#f0f0f0", outline="", width=3, tags=("tile", "rect"))
+            image_id = self.canvas.create_image(cx, cy, anchor="center", tags=("tile",))
+            text_id = self.canvas.create_text(cx, cy, text="Loading...", fill="#555555", tags=("tile",))
+            self.tiles.append((image_id, rect_id, text_id))
+            self._index_by_tim[item.tim] = i
+            for cid in (rect_id, image_id, text_id):
+                self.tile_items[cid] = item
+        rows = (len(self.media_items) + GRID_COLS - 1) // GRID_COLS
+        self.canvas.configure(scrollregion=(0, 0, TILE_GAP + GRID_COLS * step, TILE_GAP + rows * step))
+        # Thumbnails are only fetched for rows near the viewport; scrolling requests the rest
+        self._schedule_visible_check()
+
+    def _tile_at(self, event):
+        # Tk tags the item under the pointer as "current"
+        current = self.canvas.find_withtag("current")
+        return self.tile_items.get(current[0]) if current else None
+
+    def _on_grid_click(self, event):
+        item = self._tile_at(event)
+        if item:
+            self.toggle_selection(item)
+
+    def _on_grid_right_click(self, event):
+        item = self._tile_at(event)
+        if item:
+            self.open_preview(item)
+
+    def open_preview(self, item):
         p_win = ttk.Toplevel(self)
         p_win.title(f"Preview: {item.filename}{item.ext}")
-        p_win.geometry("900x750")
+        p_win.geometry(f"{PREVIEW_WIDTH}x{PREVIEW_HEIGHT}")
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 p_win.iconbitmap(self.icon_path)
         except: pass
         content_frame = tk.Frame(p_win, bg="black")
@@ -641,15 +1209,16 @@ del "%~f0"
             else:
                 sel_btn.configure(text="SELECT ITEM", bootstyle="success")
         def toggle_and_update():
-            self.toggle_selection(frame_widget, item)
+            self.toggle_selection(item)
             update_btn_state()
         sel_btn = ttk.Button(btn_frame, command=toggle_and_update)
         sel_btn.pack(fill=X, ipady=5)
         update_btn_state()
         if item.is_video:
             status_lbl.configure(text="Initializing VLC...")
-            if VIDEO_PLAYER_AVAILABLE:
-                self._run_async(self._setup_vlc_player(item.full_url, item.ext, content_frame, status_lbl, p_win))
+            if _get_vlc_instance() is not None:
+                # Stream straight from the CDN; _embed_vlc falls back to a temp-file download on error
+                self.after_idle(lambda: self._embed_vlc(content_frame, status_lbl, item.full_url, p_win, item.ext))
             else:
                 status_lbl.configure(text="VLC Media Player not found!\nPlease install VLC or use the button below.")
                 browser_btn = ttk.Button(btn_frame, text="Open in Browser", command=lambda: webbrowser.open(item.full_url), bootstyle="info-outline")
@@ -658,38 +1227,64 @@ del "%~f0"
             status_lbl.pack_forget()
             img_lbl = tk.Label(content_frame, bg="black")
             img_lbl.pack(fill=BOTH, expand=True)
-            self._run_async(self._fetch_preview(item.full_url, img_lbl, p_win))
+            original = self.preview_images.get(item.tim)
+            if original is not None:
+                self.preview_images.move_to_end(item.tim)
+            self._run_async(self._fetch_preview(item, img_lbl, p_win, original))
 
     async def _setup_vlc_player(self, url, ext, video_panel, status_lbl, window):
         temp_path = await self.worker.download_to_temp(url, ext)
         if not temp_path:
-            self.after(0, lambda: status_lbl.configure(text="Video Download Failed"))
+            self._post(lambda: status_lbl.configure(text="Video Download Failed"))
             return
-        self.after(0, lambda: self._embed_vlc(video_panel, status_lbl, temp_path, window))
+        self._post(lambda: self._embed_vlc(video_panel, status_lbl, temp_path, window))
 
-    def _embed_vlc(self, video_panel, status_lbl, video_path, window):
+    def _embed_vlc(self, video_panel, status_lbl, video_path, window, ext=None):
+        """ Play a local file or an http(s) URL; a failed stream retries through a temp-file download. """
+        is_url = video_path.startswith(("http://", "https://"))
         if not window.winfo_exists():
-            try: os.remove(video_path)
-            except: pass
+            if not is_url:
+                try: os.remove(video_path)
+                except: pass
             return
         status_lbl.place_forget()
         try:
-            instance = vlc.Instance()
+            instance = _get_vlc_instance()
             player = instance.media_player_new()
             if sys.platform == "win32":
                 player.set_hwnd(video_panel.winfo_id())
             else:
                 player.set_xwindow(video_panel.winfo_id())
             media = instance.media_new(video_path)
+            if is_url:
+                media.add_option(f":http-user-agent={USER_AGENT}")
             player.set_media(media)
+            media.release()
+            if is_url:
+                def fall_back():
+                    if not window.winfo_exists():
+                        return
+                    logger.error(f"VLC could not stream {video_path}, downloading it instead")
+                    player.stop()
+                    player.release()
+                    window.protocol("WM_DELETE_WINDOW", window.destroy)
+                    status_lbl.configure(text="Downloading video...")
+                    status_lbl.place(relx=0.5, rely=0.5, anchor="center")
+                    self._run_async(self._setup_vlc_player(video_path, ext, video_panel, status_lbl, window))
+                # Fired on a VLC thread, so hand it to the UI pump
+                player.event_manager().event_attach(
+                    vlc.EventType.MediaPlayerEncounteredError, lambda event: self._post(fall_back)
+                )
             player.play()
             def cleanup():
                 player.stop()
-                try:
-                    if os.path.exists(video_path):
-                        os.remove(video_path)
-                except Exception as e:
-                    logger.error(f"Cleanup error: {e}")
+                player.release()
+                if not is_url:
+                    try:
+                        if os.path.exists(video_path):
+                            os.remove(video_path)
+                    except Exception as e:
+                        logger.error(f"Cleanup error: {e}")
                 window.destroy()
             window.protocol("WM_DELETE_WINDOW", cleanup)
         except Exception as e:
@@ -697,40 +1292,72 @@ del "%~f0"
             status_lbl.configure(text=f"Error initializing VLC:\n{e}")
             status_lbl.place(relx=0.5, rely=0.5, anchor="center")
 
-    async def _fetch_preview(self, url, label, window):
-        data = await self.worker.fetch_image_bytes(url)
-        self.after(0, lambda: self._display_preview_image(data, label, window))
+    async def _fetch_preview(self, item, label, window, original=None):
+        box = (PREVIEW_WIDTH, PREVIEW_HEIGHT - PREVIEW_CHROME)
+        fitted = None
+        try:
+            if original is not None:
+                fitted = await self.loop.run_in_executor(self.decode_pool, fit_preview, original, box)
+            else:
+                data = self.preview_cache.get(item.tim)
+                if data is not None:
+                    self.preview_cache.move_to_end(item.tim)
+                else:
+                    cache_path = THUMB_CACHE / item.board / "full" / item.local_filename
+                    data = await self.worker.fetch_image_bytes(item.full_url, cache_path=cache_path, revalidate=True)
+                    if data:
+                        self.preview_cache[item.tim] = data
+                        while len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+                            self.preview_cache.popitem(last=False)
+                if data:
+                    # Decode and resize in the pool; only the PhotoImage is built on the Tk thread
+                    original, fitted = await self.loop.run_in_executor(self.decode_pool, decode_preview, data, box, item.ext.lower())
+        except Exception as e:
+            logger.error(f"Preview Decode Error: {e}")
+            self._post(lambda: label.configure(text="Error displaying image") if window.winfo_exists() else None)
+            return
+        self._post(lambda: self._display_preview_image(original, fitted, label, window, item.tim))
 
-    def _display_preview_image(self, data, label, window):
+    def _display_preview_image(self, original, fitted, label, window, tim=None):
         if not window.winfo_exists(): return
-        if not data:
+        if original is None:
             label.configure(text="Failed to load image.")
             return
         try:
-            pil_img = Image.open(BytesIO(data))
-            if getattr(pil_img, "is_animated", False):
-                self._animate_gif(pil_img, label, window)
+            if getattr(original, "is_animated", False):
+                self._animate_gif(original, fitted, label, window)
                 return
-            win_w = window.winfo_width()
-            win_h = window.winfo_height() - 120 
-            if win_w <= 1: win_w = 800
-            if win_h <= 1: win_h = 600
-            img_w, img_h = pil_img.size
-            ratio = min(win_w/img_w, win_h/img_h)
-            if ratio < 1:
-                new_size = (int(img_w * ratio), int(img_h * ratio))
-                pil_img = pil_img.resize(new_size, Image.Resampling.LANCZOS)
-            elif ratio > 1 and img_w < 400:
-                 new_size = (int(img_w * 2), int(img_h * 2))
-                 pil_img = pil_img.resize(new_size, Image.Resampling.NEAREST)
-            tk_img = ImageTk.PhotoImage(pil_img)
+            if tim is not None:
+                self.preview_images[tim] = original
+                self.preview_images.move_to_end(tim)
+                while len(self.preview_images) > PREVIEW_DECODED_CACHE_SIZE:
+                    self.preview_images.popitem(last=False)
+            tk_img = ImageTk.PhotoImage(fitted)
             label.configure(image=tk_img, text="")
             label.image = tk_img
         except Exception as e:
             logger.error(f"Preview Display Error: {e}")
             label.configure(text="Error displaying image")
 
-    def _animate_gif(self, pil_img, label, window):
+    def _animate_gif(self, pil_img, frames, label, window):
+        if frames is not None:
+            # Frames were fitted once in the decode pool; each PhotoImage is built on first show, then reused
+            pil_frames = [frame for frame, _ in frames]
+            durations = [duration for _, duration in frames]
+            del frames
+            tk_frames = [None] * len(pil_frames)
+            def cycle(i):
+                if not window.winfo_exists(): return
+                if tk_frames[i] is None:
+                    tk_frames[i] = ImageTk.PhotoImage(pil_frames[i])
+                    pil_frames[i] = None  # Tk keeps its own copy of the pixels
+                label.configure(image=tk_frames[i], text="")
+                label.image = tk_frames[i]
+                label.after(durations[i], lambda: cycle((i + 1) % len(tk_frames)))
+            cycle(0)
+            return
+        # Same fixed box as the prerendered path and static previews
+        win_w, win_h = PREVIEW_WIDTH, PREVIEW_HEIGHT - PREVIEW_CHROME
         frames = ImageSequence.Iterator(pil_img)
         def stream(iterator):
             if not window.winfo_exists(): return
@@ -739,18 +1366,14 @@ del "%~f0"
             except StopIteration:
                 iterator = ImageSequence.Iterator(pil_img)
                 frame = next(iterator)
-            win_w = window.winfo_width()
-            win_h = window.winfo_height() - 120 
-            if win_w <= 1: win_w = 800
-            if win_h <= 1: win_h = 600
             img_w, img_h = frame.size
             ratio = min(win_w/img_w, win_h/img_h)
             if ratio < 1:
                 new_size = (int(img_w * ratio), int(img_h * ratio))
-                frame = frame.resize(new_size, Image.Resampling.BOX)
+                frame = frame.resize(new_size, _Resampling.BOX)
             elif ratio > 1 and img_w < 400:
                  new_size = (int(img_w * 2), int(img_h * 2))
-                 frame = frame.resize(new_size, Image.Resampling.BOX)
+                 frame = frame.resize(new_size, _Resampling.BILINEAR)
             tk_img = ImageTk.PhotoImage(frame)
             label.configure(image=tk_img, text="")
             label.image = tk_img
@@ -759,64 +1382,155 @@ del "%~f0"
             label.after(duration, lambda: stream(iterator))
         stream(frames)
 
-    async def _fetch_thumbnails(self):
-        chunk_size = 10
-        for i in range(0, len(self.media_items), chunk_size):
-            chunk = self.media_items[i:i+chunk_size]
-            tasks = [self.worker.fetch_image_bytes(item.thumb_url) for item in chunk]
-            results = await asyncio.gather(*tasks)
-            self.after(0, lambda res=results, idx=i: self.update_thumbnails(res, idx))
-
-    def update_thumbnails(self, image_data_list, start_index):
-        children = self.scrollable_frame.winfo_children()
-        for i, data in enumerate(image_data_list):
-            if not data: continue
-            widget_idx = start_index + i
-            if widget_idx >= len(children): break
-            frame = children[widget_idx]
+    async def _fetch_thumbnails(self, indices, generation):
+        # Worker semaphore bounds concurrency; each result is shown as soon as it lands
+        async def fetch_one(idx, item):
+            if generation != self._grid_generation:
+                return idx, None  # Thread changed while this waited for a slot
+            data = await self._load_thumb_bytes(item)
+            if not data:
+                return idx, None
+            resized_path = THUMB_CACHE / item.board / f"{item.tim}s_150.jpg"
+            args = (decode_thumbnail, data, item.ext, item.is_video, item.is_gif, resized_path)
+            try:
+                try:
+                    decoded = await self.loop.run_in_executor(self.thumb_pool, *args)
+                except BrokenProcessPool as e:
+                    # A dead worker breaks the whole pool; don't fail every remaining tile with it
+                    logger.error(f"Thumbnail process pool broke, decoding on threads: {e}")
+                    self.thumb_pool = self.decode_pool
+                    decoded = await self.loop.run_in_executor(self.decode_pool, *args)
+            except Exception as e:
+                logger.error(f"Error decoding thumb: {e}")
+                decoded = None
+            return idx, decoded
+
+        if generation != self._grid_generation:
+            return
+        items = self.media_items
+        tasks = [asyncio.ensure_future(fetch_one(i, items[i])) for i in indices]
+        for next_done in asyncio.as_completed(tasks):
+            idx, decoded = await next_done
+            self._post(lambda idx=idx, decoded=decoded: self.update_single_thumbnail(idx, decoded, generation))
+
+    async def _load_thumb_bytes(self, item):
+        # Prefer the already-resized copy so cache hits skip the downscale too
+        board_cache = THUMB_CACHE / item.board
+        resized_path = board_cache / f"{item.tim}s_150.jpg"
+        if resized_path.exists():
             try:
-                pil_img = Image.open(BytesIO(data))
-                pil_img.thumbnail((150, 150)) 
-                if frame.item.is_video or frame.item.is_gif:
-                    draw = ImageDraw.Draw(pil_img)
-                    ext_text = frame.item.ext.upper().lstrip('.')
-                    color = "#0984e3" if frame.item.is_gif else "red"
-                    draw.rectangle([0, 0, 40, 15], fill=color)
-                    draw.text((2, 1), ext_text, fill="white")
-                tk_img = ImageTk.PhotoImage(pil_img)
-                frame.lbl.configure(image=tk_img, text="", width=0, height=0, bg="white")
-                self.thumbnails[frame.item.tim] = tk_img
+                return await self.loop.run_in_executor(None, resized_path.read_bytes)
             except Exception as e:
-                logger.error(f"Error loading thumb: {e}")
-        self.status_var.set(f"Loaded {min(start_index + len(image_data_list), len(self.media_items))}/{len(self.media_items)} thumbnails")
+                logger.error(f"Failed to read cache {resized_path}: {e}")
+        # Thumbnails are immutable per tim and read through the resized copy, so they are never revalidated
+        return await self.worker.fetch_image_bytes(item.thumb_url, cache_path=board_cache / f"{item.tim}s.jpg")
 
-    def toggle_selection(self, frame, item):
+    def update_single_thumbnail(self, index, decoded, generation):
+        if generation != self._grid_generation or index >= len(self.tiles):
+            return
+        self._thumbs_inflight.discard(index)
+        if index not in self._thumbs_done:
+            self._thumbs_done.add(index)
+            self.status_var.set(f"Loaded {len(self._thumbs_done)}/{len(self.media_items)} thumbnails")
+        if not decoded:
+            self._thumbs_failed.add(index)
+            return
+        image_id, rect_id, text_id = self.tiles[index]
+        try:
+            raw, size = decoded
+            # PhotoImage must be filled on the Tk thread; everything else happened in the pool
+            tk_img = self.thumbnails.get(index)
+            if tk_img is None:
+                tk_img = self._photo_pool.pop() if self._photo_pool else ImageTk.PhotoImage("RGBA", (THUMB_SIZE, THUMB_SIZE))
+            tk_img.paste(Image.frombytes("RGBA", size, raw))
+            self.canvas.itemconfigure(image_id, image=tk_img)
+            self.canvas.itemconfigure(rect_id, fill="white")
+            self.canvas.itemconfigure(text_id, text="")
+            self.thumbnails[index] = tk_img
+            self.thumbnails.move_to_end(index)
+            while len(self.thumbnails) > THUMB_MEMORY_LIMIT:
+                self._evict_thumbnail(*self.thumbnails.popitem(last=False))
+        except Exception as e:
+            logger.error(f"Error loading thumb: {e}")
+
+    def _evict_thumbnail(self, index, tk_img):
+        image_id, rect_id, text_id = self.tiles[index]
+        self.canvas.itemconfigure(image_id, image="")
+        self.canvas.itemconfigure(rect_id, fill="#f0f0f0")
+        self.canvas.itemconfigure(text_id, text="Loading...")
+        self._recycle_photo(tk_img)
+        # The evicted tile may be on screen, so check without waiting for a scroll
+        self._schedule_visible_check()
+
+    def _recycle_photo(self, tk_img):
+        if len(self._photo_pool) < THUMB_MEMORY_LIMIT:
+            self._photo_pool.append(tk_img)
+
+    def _on_grid_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_visible_check()
+
+    def _schedule_visible_check(self):
+        if not self._visible_check_pending:
+            self._visible_check_pending = True
+            self.after_idle(self._reload_visible_thumbnails)
+
+    def _reload_visible_thumbnails(self):
+        """ Request thumbnails for tiles in or near the viewport that were never loaded or were evicted. """
+        self._visible_check_pending = False
+        if not self.tiles:
+            return
+        step = TILE_SIZE + TILE_GAP
+        first_row = max(0, int(self.canvas.canvasy(0) // step) - THUMB_PREFETCH_ROWS)
+        last_row = int(self.canvas.canvasy(self.canvas.winfo_height()) // step) + THUMB_PREFETCH_ROWS
+        end = min(len(self.tiles), (last_row + 1) * GRID_COLS)
+        missing = []
+        for idx in range(first_row * GRID_COLS, end):
+            if idx in self.thumbnails:
+                self.thumbnails.move_to_end(idx)
+            elif idx not in self._thumbs_inflight and idx not in self._thumbs_failed:
+                self._thumbs_inflight.add(idx)
+                missing.append(idx)
+        if missing:
+            self._run_async(self._fetch_thumbnails(missing, self._grid_generation))
+
+    def toggle_selection(self, item):
+        index = self._index_by_tim.get(item.tim)
+        tile = self.tiles[index] if index is not None else None
         if item.tim in self.selected_items:
             self.selected_items.remove(item.tim)
-            frame.configure(bg="white", relief=tk.FLAT)
+            self._selected_bytes -= item.fsize
+            outline = ""
         else:
             self.selected_items.add(item.tim)
-            frame.configure(bg="#4CAF50", relief=tk.SOLID)
-        self.update_download_btn()
+            self._selected_bytes += item.fsize
+            outline = "#4CAF50"
+        if tile:
+            self.canvas.itemconfigure(tile[1], outline=outline)
+        self.selected_count_var.set(len(self.selected_items))
 
     def select_all(self):
-        for frame in self.scrollable_frame.winfo_children():
-            if hasattr(frame, 'item'):
-                self.selected_items.add(frame.item.tim)
-                frame.configure(bg="#4CAF50", relief=tk.SOLID)
-        self.update_download_btn()
+        # Tiles are canvas items tagged "rect", so the outline change is one Tcl call either way;
+        # skipping no-op clicks also saves the button re-render from the count trace
+        if len(self.selected_items) == len(self._fsize_by_tim):
+            return
+        self.selected_items.update(self._fsize_by_tim)
+        self._selected_bytes = sum(map(self._fsize_by_tim.__getitem__, self.selected_items))
+        self.canvas.itemconfigure("rect", outline="#4CAF50")
+        self.selected_count_var.set(len(self.selected_items))
 
     def deselect_all(self):
+        if not self.selected_items:
+            return
         self.selected_items.clear()
-        for frame in self.scrollable_frame.winfo_children():
-            frame.configure(bg="white", relief=tk.FLAT)
-        self.update_download_btn()
+        self._selected_bytes = 0
+        self.canvas.itemconfigure("rect", outline="")
+        self.selected_count_var.set(0)
 
     def update_download_btn(self):
-        count = len(self.selected_items)
-        
-        total_bytes = sum(item.fsize for item in self.media_items if item.tim in self.selected_items)
-        
+        count = self.selected_count_var.get()
+        total_bytes = self._selected_bytes
+
         if total_bytes < 1024 * 1024:
             size_str = f"{total_bytes / 1024:.1f} KB"
         else:
@@ -843,45 +1557,114 @@ del "%~f0"
         self.download_btn.configure(state=DISABLED)
         self.status_var.set(f"Starting download...")
         self.progress_var.set(0)
-        self._run_async(self._download_files(items_to_download, save_path))
+        # [finished, succeeded, bytes_done, total_bytes, skipped]; written by the worker loop,
+        # read by a 100ms Tk tick instead of posting a UI update per chunk or file
+        self._dl_counter = [0, 0, 0, 0, 0]
+        self._dl_total = len(items_to_download)
+        self.after(100, self._refresh_download_ui)
+        self._run_async(self._download_files(items_to_download, save_path, self._dl_counter))
+
+    def _refresh_download_ui(self):
+        counter = self._dl_counter
+        if counter is None:
+            return  # Download finished; _finish_download already reset the bar
+        self.progress_var.set(self._download_progress(counter, self._dl_total))
+        if counter[0]:
+            status = f"Downloading: {counter[1]}/{self._dl_total}"
+            if counter[4]:
+                status += f" ({counter[4]} already on disk)"
+            self.status_var.set(status)
+        self.after(100, self._refresh_download_ui)
+
+    def _finish_download(self, success_count, save_path):
+        self._dl_counter = None
+        self.status_var.set("Ready")
+        self.progress_var.set(0)
+        self.update_download_btn()
+        # Outside the pump batch, so the modal dialog doesn't hold up other queued callbacks
+        self.after_idle(messagebox.showinfo, "Complete", f"Downloaded {success_count} files to:\n{save_path}")
 
-    async def _download_files(self, items, save_path):
-        success_count = 0
+    async def _download_files(self, items, save_path, counter):
         total_items = len(items)
-        for i, item in enumerate(items):
-            filepath = save_path / item.local_filename
-            if filepath.exists():
-                success_count += 1
-            else:
-                data = await self.worker.fetch_image_bytes(item.full_url)
-                if data:
-                    try:
-                        with open(filepath, "wb") as f:
-                            f.write(data)
-                        success_count += 1
-                    except Exception as e:
-                        logger.error(f"Write error: {e}")
-            progress = ((i + 1) / total_items) * 100
-            self.after(0, lambda p=progress: self.progress_var.set(p))
-            self.after(0, lambda c=success_count, t=total_items: self.status_var.set(f"Downloading: {c}/{t}"))
-        self.after(0, lambda: messagebox.showinfo("Complete", f"Downloaded {success_count} files to:\n{save_path}"))
-        self.after(0, lambda: self.status_var.set("Ready"))
-        self.after(0, self.update_download_btn)
-        self.after(0, lambda: self.progress_var.set(0))
+        # Files already on disk never take a download slot
+        def pending_items():
+            return [item for item in items if not (save_path / item.local_filename).exists()]
+        to_fetch = await self.loop.run_in_executor(None, pending_items)
+        skipped = total_items - len(to_fetch)
+        # Progress is by bytes, using the sizes from the thread JSON; files only if those are missing
+        total_bytes = sum(item.fsize for item in items)
+        counter[:] = [skipped, skipped, total_bytes - sum(item.fsize for item in to_fetch), total_bytes, skipped]
+        tasks = [asyncio.ensure_future(self._download_one(item, save_path, counter)) for item in to_fetch]
+        # One failing task must not skip the completion dialog and leave the button disabled
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Download task failed: {result}")
+        success_count = counter[1]
+        self._post(lambda: self._finish_download(success_count, save_path))
+
+    async def _download_one(self, item, save_path, counter):
+        filepath = save_path / item.local_filename
+        def on_progress(delta):
+            counter[2] += delta
+        # A previewed image is already in the media cache; copy it instead of fetching it again
+        cached = THUMB_CACHE / item.board / "full" / item.local_filename
+        def copy_cached():
+            if not cached.exists():
+                return False
+            part_path = filepath.with_name(filepath.name + ".part")
+            shutil.copyfile(cached, part_path)
+            os.replace(part_path, filepath)
+            return True
+        try:
+            copied = await self.loop.run_in_executor(None, copy_cached)
+        except OSError as e:
+            logger.error(f"Failed to copy {cached} from cache: {e}")
+            copied = False
+        if copied:
+            counter[0] += 1
+            counter[1] += 1
+            counter[2] += item.fsize
+            return
+        async with self.worker.download_sem:
+            ok = await self.worker.download_to_file(item.full_url, filepath, on_progress=on_progress)
+        counter[0] += 1
+        if ok:
+            counter[1] += 1
+
+    @staticmethod
+    def _download_progress(counter, total_items):
+        finished, _, bytes_done, total_bytes, _ = counter
+        if total_bytes:
+            return min(bytes_done / total_bytes, 1.0) * 100
+        return (finished / total_items) * 100
 
     def on_close(self):
-        self.save_settings()
+        self.save_settings(wait=True)
         if self.worker.session:
             self._run_async(self.worker.close_session())
+        self.decode_pool.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+        if _vlc_instance is not None:
+            _vlc_instance.release()
         self.destroy()
 
+    def _icon_photo(self, size):
+        """ The app icon as a PhotoImage, decoded and scaled once per size; the cache keeps it alive. """
+        tk_icon = self._icon_photos.get(size)
+        if tk_icon is None:
+            with Image.open(self.icon_path) as img:
+                tk_icon = ImageTk.PhotoImage(img.convert("RGBA").resize((size, size), _Resampling.LANCZOS))
+            self._icon_photos[size] = tk_icon
+        return tk_icon
+
     def show_about(self):
         about_win = ttk.Toplevel(self)
         about_win.title("About")
         about_win.geometry("450x250")
         about_win.resizable(False, False)
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 about_win.iconbitmap(self.icon_path)
         except: pass
         x = self.winfo_x() + (self.winfo_width() // 2) - 225
@@ -890,14 +1673,9 @@ del "%~f0"
         frame = ttk.Frame(about_win, padding=20)
         frame.pack(fill=BOTH, expand=True)
         try:
-            if os.path.exists(self.icon_path):
-                with Image.open(self.icon_path) as img:
-                    img = img.convert("RGBA")
-                    pil_img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                    tk_icon = ImageTk.PhotoImage(pil_img)
-                    icon_lbl = ttk.Label(frame, image=tk_icon)
-                    icon_lbl.image = tk_icon
-                    icon_lbl.grid(row=0, column=0, rowspan=4, padx=(0, 20), sticky="n")
+            if self.has_icon:
+                icon_lbl = ttk.Label(frame, image=self._icon_photo(64))
+                icon_lbl.grid(row=0, column=0, rowspan=4, padx=(0, 20), sticky="n")
             else:
                 ttk.Label(frame, text="🍀", font=("Segoe UI", 32)).grid(row=0, column=0, rowspan=4, padx=(0, 20))
         except Exception:
@@ -916,7 +1694,7 @@ del "%~f0"
         help_win.title("Help & Instructions")
         help_win.geometry("600x500")
         try:
-            if os.path.exists(self.icon_path):
+            if self.has_icon:
                 help_win.iconbitmap(self.icon_path)
         except: pass
         help_text = """4chan Media Scraper - User Guide
@@ -951,6 +1729,7 @@ Troubleshooting:
         text_widget.configure(state=DISABLED)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Lets the thumbnail pool start from a frozen .exe
     app = ChanScraperApp()
     app.protocol("WM_DELETE_WINDOW", app.on_close)
     app.mainloop()
\ No newline at end of file